@@ -1,8 +1,12 @@
-from functools import lru_cache
+from collections import defaultdict
+from functools import cached_property, wraps
 import logging
 import re
+import threading
+import time
 import trio
 from typing import Union
+import weakref
 
 from olive.devices.base import Device, DeviceInfo
 from olive.core import Driver
@@ -12,6 +16,7 @@ from olive.devices.motion import Axis
 
 from .wrapper import (
     AxisCommand,
+    BufferOverflowError,
     ControllerCommand,
     Communication,
     ReferenceMode,
@@ -23,30 +28,86 @@ __all__ = ["GCS2"]
 
 logger = logging.getLogger(__name__)
 
+# <Command> <Description>
+_COMMAND_RE = re.compile(r"^(\S+) (.*)$", re.M)
+# <Key>:<Version>
+_VERSION_RE = re.compile(r"^([^:\n]+):(.*)$", re.M)
+# 0x<PamID>=<CmdLevel>\t<MaxItem>\t<DataType>\t<FuncDesc>\t<Desc>
+_PARAMETER_RE = re.compile(
+    r"^0x([0-9A-Fa-f]+)=[ \t]*"
+    r"([^\t\n]*)\t([^\t\n]*)\t([^\t\n]*)\t[^\t\n]*\t([^\t\r\n]*)",
+    re.M,
+)
+# parameter name normalization
+_NAME_SEP_RE = re.compile(r"[\-\s]+")
+_NAME_INVALID_RE = re.compile(r"[^0-9a-zA-Z_]+")
+
+
+def connection_cached(func):
+    """
+    Cache result of a method without arguments until the connection is closed.
+    The method is evaluated under the controller lock.
+    """
+
+    @wraps(func)
+    def wrapper(self):
+        try:
+            return self._connection_cache[func.__name__]
+        except KeyError:
+            with self._lock:
+                if func.__name__ not in self._connection_cache:
+                    self._connection_cache[func.__name__] = func(self)
+            return self._connection_cache[func.__name__]
+
+    return wrapper
+
 
 class PIAxis(Axis):
     def __init__(self, parent, axis_id, *args, **kwargs):
         super().__init__(parent.driver, *args, parent=parent, **kwargs)
+        self._axis_id = axis_id
         self._handle = AxisCommand(parent.handle.ctrl_id, axis_id)
 
+        # parameter table of the controller, name -> (pid, dtype, max_item)
+        self._available_parameters = None
+        # non-volatile parameters, pid -> (value_num, value_str)
+        self._parameters = dict()
+
     async def _open(self):
         # must use closed-loop
-        self.handle.set_servo_state(ServoState.ClosedLoop)
+        await self.parent._run_sync(self.handle.set_servo_state, ServoState.ClosedLoop)
 
         await self.calibrate()
 
     ##
 
     async def enumerate_properties(self):
-        return tuple((await self.parent.get_property("available_parameters")).keys())
+        return tuple((await self._parameter_table()).keys())
 
     async def get_property(self, name):
-        prop_detail = (await self.parent.get_property("available_parameters"))[name]
-        pid, dtype, max_item = prop_detail
-        value_num, value_str = self.handle.get_parameter(pid)
-        if dtype == "char":
-            return value_str
-        else:
+        return (await self.get_properties((name,)))[name]
+
+    async def get_properties(self, names):
+        """
+        Get multiple properties, uncached parameters are queried in a single
+        transaction.
+
+        Args:
+            names (list of str): property names
+        """
+        parameters = await self._parameter_table()
+        prop_details = {name: parameters[name] for name in names}
+        await self.parent._run_sync(
+            self._load_parameters, [pid for pid, _, _ in prop_details.values()]
+        )
+
+        result = dict()
+        for name, (pid, dtype, max_item) in prop_details.items():
+            value_num, value_str = self._parameters[pid]
+            if dtype == "char":
+                result[name] = value_str
+                continue
+
             # extract limited portion to prevent memory access violation
             value_num = value_num[:max_item]
 
@@ -55,47 +116,84 @@ class PIAxis(Axis):
                 value_num = [int(v) for v in value_num]
 
             # simplify
-            return value_num[0] if max_item == 1 else value_num
+            result[name] = value_num[0] if max_item == 1 else value_num
+        return result
 
     async def set_property(self, name, value):
         raise NotImplementedError
 
+    async def _parameter_table(self):
+        """
+        Parameter table is bound from the controller once, instead of going
+        through its property accessor on every access.
+        """
+        if self._available_parameters is None:
+            self._available_parameters = await self.parent.get_property(
+                "available_parameters"
+            )
+        return self._available_parameters
+
+    def invalidate(self):
+        """Drop cached parameter values, next access will query the controller."""
+        self._parameters.clear()
+
+    def cache_parameter(self, pid, value_num, value_str):
+        """Store a parameter value that was queried along with other axes."""
+        self._parameters[pid] = ([value_num], value_str)
+
+    def _load_parameters(self, pids):
+        """
+        Query parameters that are not cached yet in a single transaction.
+
+        Args:
+            pids (list of int): parameter IDs
+        """
+        pids = [pid for pid in pids if pid not in self._parameters]
+        if not pids:
+            return
+        values_num, values_str = self.handle.get_parameters(
+            [self._axis_id] * len(pids), pids
+        )
+        for i, pid in enumerate(pids):
+            value_str = values_str[i] if i < len(values_str) else ""
+            self._parameters[pid] = ([values_num[i]], value_str)
+
     ##
 
     async def home(self):
-        await trio.to_thread.run_sync(self.handle.go_to_home)
+        await self.parent._run_sync(self.handle.go_to_home)
 
     async def get_position(self):
-        return await trio.to_thread.run_sync(self.handle.get_current_position)
+        return await self.parent._run_sync(self.handle.get_current_position)
 
     async def set_absolute_position(self, pos):
-        await trio.to_thread.run_sync(self.handle.set_target_position, pos)
+        await self.parent._run_sync(self.handle.set_target_position, pos)
 
     async def set_relative_position(self, pos):
-        await trio.to_thread.run_sync(self.handle.set_relative_target_position, pos)
+        await self.parent._run_sync(self.handle.set_relative_target_position, pos)
         await self.wait()
 
     ##
 
     async def get_velocity(self):
-        return await trio.to_thread.run_sync(self.handle.get_velocity)
+        return await self.parent._run_sync(self.handle.get_velocity)
 
     async def set_velocity(self, vel):
-        await trio.to_thread.run_sync(self.handle.set_velocity, vel)
+        await self.parent._run_sync(self.handle.set_velocity, vel)
 
     ##
 
     async def get_acceleration(self):
-        return await trio.to_thread.run_sync(self.handle.get_acceleration)
+        return await self.parent._run_sync(self.handle.get_acceleration)
 
     async def set_acceleration(self, acc):
-        await trio.to_thread.run_sync(self.handle.set_acceleration, acc)
+        await self.parent._run_sync(self.handle.set_acceleration, acc)
 
     ##
 
     async def set_origin(self):
         # reset counter, trivial
-        self.handle.set_current_position(0)
+        await self.parent._run_sync(self.handle.set_current_position, 0)
 
     async def get_limits(self):
         """
@@ -105,8 +203,8 @@ class PIAxis(Axis):
         NLM set lower limits (soft limit)
         PLM set higher limits (soft limit)
         """
-        lo = await trio.to_thread.run_sync(self.handle.get_travel_range_min)
-        hi = await trio.to_thread.run_sync(self.handle.get_travel_range_max)
+        lo = await self.parent._run_sync(self.handle.get_travel_range_min)
+        hi = await self.parent._run_sync(self.handle.get_travel_range_max)
         return lo, hi
 
     async def set_limits(self):
@@ -115,45 +213,51 @@ class PIAxis(Axis):
     ##
 
     async def calibrate(self):
-        if self.handle.is_referenced():
+        if await self.parent._run_sync(self.handle.is_referenced):
             return
         logger.debug("calibrating...")
 
         # start referencing
-        self.handle.set_reference_mode(ReferenceMode.Absolute)
-        await trio.to_thread.run_sync(
+        await self.parent._run_sync(
+            self.handle.set_reference_mode, ReferenceMode.Absolute
+        )
+        await self.parent._run_sync(
             self.handle.start_reference_movement, ReferenceStrategy.ReferenceSwitch
         )
         # ... wait till complete
         await self.wait()
         # reset
-        self.handle.set_reference_mode(ReferenceMode.Relative)
+        await self.parent._run_sync(
+            self.handle.set_reference_mode, ReferenceMode.Relative
+        )
         await self.set_origin()
 
     async def stop(self, emergency=False):
         if emergency:
-            self.handle.stop_all()
+            await self.parent._run_sync(self.handle.stop_all)
         else:
-            self.handle.halt()
+            await self.parent._run_sync(self.handle.halt)
 
     async def wait(self):
-        while self.busy:
-            await trio.sleep(1)
+        # poll with exponential backoff, short moves return quickly
+        delay = 0.001
+        while await self.parent._run_sync(lambda: self.busy):
+            await trio.sleep(delay)
+            delay = min(delay * 2, 0.05)
 
     ##
 
     @property
     def busy(self):
-        return self.parent.busy or self.handle.is_moving()
+        return self.parent.busy or self.parent._locked(self.handle.is_moving)
 
     @property
     def handle(self):
         return self._handle
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def info(self):
-        model = self.handle.get_stage_type().strip()
+        model = self.parent._locked(self.handle.get_stage_type).strip()
         model = model.split("=")[1]
 
         # extract info from parent
@@ -178,7 +282,7 @@ class PILinear(PIAxis, LinearAxis):
             await self.open()
             if (await self.get_property("is_rotary_stage")) > 0:
                 raise UnsupportedClassError
-            logger.info(f".. {self.info}")
+            logger.info(".. %s", await trio.to_thread.run_sync(lambda: self.info))
         except RuntimeError as err:
             logger.exception(err)
             raise UnsupportedClassError
@@ -199,7 +303,7 @@ class PIRotary(PIAxis, RotaryAxis):
             await self.open()
             if (await self.get_property("is_rotary_stage")) == 0:
                 raise UnsupportedClassError
-            logger.info(f".. {self.info}")
+            logger.info(".. %s", await trio.to_thread.run_sync(lambda: self.info))
         except RuntimeError as err:
             logger.exception(err)
             raise UnsupportedClassError
@@ -208,33 +312,49 @@ class PIRotary(PIAxis, RotaryAxis):
 
 
 class PIController(MotionController):
+    # buffer size that fits the last response of each query, name -> nbytes
+    _response_size = dict()
+    # number of axes allowed to run their reference movements at the same time
+    _max_referencing = 2
+
     def __init__(self, driver, desc_str, *args, **kwargs):
         super().__init__(driver, *args, **kwargs)
         self._desc_str, self._handle = desc_str, None
+        # responses that are fixed for the lifetime of a connection
+        self._connection_cache = dict()
+        # the DLL reports errors per controller ID, and handles reuse their
+        # response buffer, calls from the controller and its axes are serialized,
+        # pooled connections bring their own lock
+        self._lock = threading.RLock()
+
+        # last busy state, (timestamp, state)
+        self._busy = (float("-inf"), False)
 
     ##
 
     async def test_open(self):
+        """
+        Probe the controller. Connection is kept alive on success, caller is
+        responsible to close it.
+        """
         try:
             await self.open()
-            logger.info(f".. {self.info}")
+            logger.info(".. %s", await trio.to_thread.run_sync(lambda: self.info))
         except RuntimeError as err:
             logger.exception(err)
-            raise UnsupportedClassError
-        finally:
             await self.close()
+            # do not keep a broken connection around
+            await self.driver._disconnect_usb(self.desc_str, self)
+            raise UnsupportedClassError
 
     async def _open(self):
-        ctrl_id = await trio.to_thread.run_sync(
-            self.driver.api.connect_usb, self.desc_str
-        )
+        ctrl_id, self._lock = await self.driver._connect_usb(self.desc_str, self)
         self._handle = ControllerCommand(ctrl_id)
 
     async def _close(self):
-        await trio.to_thread.run_sync(
-            self.driver.api.close_connection, self.handle.ctrl_id
-        )
+        # USB connection stays in the driver pool until shutdown
         self._handle = None
+        self._connection_cache.clear()
 
     ##
 
@@ -243,24 +363,24 @@ class PIController(MotionController):
 
     ##
 
+    @connection_cached
     def _get_available_commands(self):
         response = PIController._retrieve_large_response(
-            self.handle.get_available_commands
+            self.handle.get_available_commands, start_size=2 ** 18
         )
 
-        result = dict()
-        for line in response.split("\n"):
-            key, value = tuple(line.split(" ", maxsplit=1))
-            result[key.strip()] = value.strip()
+        result = {
+            m.group(1): m.group(2).strip() for m in _COMMAND_RE.finditer(response)
+        }
 
         # TODO isolate syntax / help string
 
         return result
 
-    @lru_cache(maxsize=1)
+    @connection_cached
     def _get_available_parameters(self):
         response = PIController._retrieve_large_response(
-            self.handle.get_available_parameters
+            self.handle.get_available_parameters, start_size=2 ** 18
         )
 
         # response format
@@ -272,13 +392,9 @@ class PIController(MotionController):
         #       <Desc>
         #       [{\t<Value>=<Desc>}]
         pids = dict()
-        for line in response.split("\n"):
-            if not line.startswith("0x"):
-                continue
-            pid, desc = line.split("=", maxsplit=1)
-            pid, desc = int(pid, 16), desc.strip()
-
-            cmd_level, max_item, dtype, _, desc, *options = desc.split("\t")
+        for m in _PARAMETER_RE.finditer(response):
+            pid, cmd_level, max_item, dtype, desc = m.groups()
+            pid = int(pid, 16)
 
             # normalize the name
             #   'Device S/N'
@@ -287,10 +403,9 @@ class PIController(MotionController):
             #       -> 'closed_loop_deceleration_for_hi_control'
             #   'Is Rotary Stage?'
             #       -> 'is_rotary_stage'
-            desc = desc.lower()
-            desc = desc.split("(")[0].strip()
-            desc = re.sub(r"[\-\s]+", "_", desc)
-            desc = re.sub(r"[^0-9a-zA-Z_]+", "", desc)
+            desc = desc.lower().partition("(")[0].strip()
+            desc = _NAME_SEP_RE.sub("_", desc)
+            desc = _NAME_INVALID_RE.sub("", desc)
 
             # normalize paramter info
             dtype, max_item = dtype.lower(), int(max_item)
@@ -298,6 +413,7 @@ class PIController(MotionController):
             pids[desc] = (pid, dtype, max_item)
         return pids
 
+    @connection_cached
     def _get_versions(self):
         """
         Note:
@@ -306,40 +422,107 @@ class PIController(MotionController):
         response = PIController._retrieve_large_response(self.handle.get_version)
 
         # split version strings
-        result = dict()
-        for line in response.split("\n"):
-            key, value = tuple(line.split(":", maxsplit=1))
-            result[key.strip()] = value.strip()
-
-        return result
+        return {
+            m.group(1).strip(): m.group(2).strip()
+            for m in _VERSION_RE.finditer(response)
+        }
 
     ##
 
     async def enumerate_axes(self) -> Union[PILinear, PIRotary]:
-        ax_klass, ax_id = (
-            set(PIAxis.__subclasses__()),
-            self.handle.get_axes_id().strip().split("\n"),
-        )
+        # drop malformed identifiers before spending USB transactions on them
+        pattern = await self._run_sync(self._axis_id_pattern)
+        response = await self._run_sync(self.handle.get_axes_id)
+        ax_id = [
+            axis_id.strip()
+            for axis_id in response.splitlines()
+            if pattern.fullmatch(axis_id.strip())
+        ]
+        if not ax_id:
+            # empty axis list stands for all the axes in the DLL
+            return tuple()
+
+        parameters = await self._run_sync(self._get_available_parameters)
+        pid, _, _ = parameters["is_rotary_stage"]
+        stage_types = await self._run_sync(self._query_stage_types, ax_id, pid)
+
+        # probe concurrently, waits of the referencing movements overlap
+        limiter = trio.CapacityLimiter(self._max_referencing)
+        axes = [None] * len(stage_types)
+        async with trio.open_nursery() as nursery:
+            for i, stage_type in enumerate(stage_types):
+                nursery.start_soon(self._probe_axis, limiter, pid, stage_type, axes, i)
+        return tuple(axis for axis in axes if axis is not None)
+
+    def _query_stage_types(self, ax_id, pid):
+        """
+        Query stage type of all the axes in a single transaction. If the batch
+        fails, axes are queried one by one and the failed ones are dropped.
+
+        Returns:
+            (list of tuple): (axis_id, value_num, value_str) of each valid axis
+        """
+        try:
+            values_num, values_str = self.handle.get_parameters(
+                ax_id, [pid] * len(ax_id)
+            )
+            return [
+                (axis_id, values_num[i], values_str[i] if i < len(values_str) else "")
+                for i, axis_id in enumerate(ax_id)
+            ]
+        except RuntimeError as err:
+            # a single invalid axis fails the batch, e.g. a deactivated one
+            logger.debug("batched stage type query failed, %s", err)
 
-        axes = []
+        stage_types = []
         for axis_id in ax_id:
-            for klass in ax_klass:
-                axis = klass(self, axis_id)
-                try:
-                    await axis.test_open()
-                    axes.append(axis)
-                    break
-                except UnsupportedClassError:
-                    pass
-            else:
-                logger.error(f"unknown axes {axis_id}")
-        return tuple(axes)
+            try:
+                values_num, values_str = self.handle.get_parameters([axis_id], [pid])
+            except RuntimeError as err:
+                logger.exception(err)
+                logger.error("unknown stage type, axis %s", axis_id)
+                continue
+            stage_types.append((axis_id, values_num[0], values_str[0]))
+        return stage_types
+
+    async def _probe_axis(self, limiter, pid, stage_type, results, i):
+        """
+        Instantiate axis class from its stage type, then open the axis once to
+        verify it. Valid axis is stored in results[i].
+
+        Args:
+            limiter (trio.CapacityLimiter): limits concurrent reference movements
+            pid (int): parameter ID of the stage type
+            stage_type (tuple): (axis_id, value_num, value_str) of the axis
+        """
+        axis_id, is_rotary, value_str = stage_type
+        klass = PIRotary if is_rotary > 0 else PILinear
+        axis = klass(self, axis_id)
+        # the axis does not need to query it again
+        axis.cache_parameter(pid, is_rotary, value_str)
+        try:
+            async with limiter:
+                await axis.test_open()
+            results[i] = axis
+        except UnsupportedClassError:
+            logger.error("unknown axes %s", axis_id)
 
     ##
 
     @property
     def busy(self):
-        return self.handle.is_running_macro() or not self.handle.is_controller_ready()
+        """
+        Controller state is kept for 5 ms, polling loops faster than that
+        should not cost two USB transactions per iteration.
+        """
+        timestamp, busy = self._busy
+        now = time.monotonic()
+        if now - timestamp > 0.005:
+            with self._lock:
+                busy = self.handle.is_running_macro()
+                busy = busy or not self.handle.is_controller_ready()
+            self._busy = (now, busy)
+        return busy
 
     @property
     def handle(self):
@@ -349,13 +532,13 @@ class PIController(MotionController):
     def desc_str(self):
         return self._desc_str
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def info(self):
-        response = self.handle.get_identification_string()
-        vendor, model, sn, version = tuple(
-            token.strip() for token in response.split(",")
-        )
+        response = self._locked(self.handle.get_identification_string)
+        # version is the last field, and may contain commas
+        vendor, model, sn, version = [
+            token.strip() for token in response.split(",", maxsplit=3)
+        ]
         return DeviceInfo(vendor=vendor, model=model, version=version, serial_number=sn)
 
     @property
@@ -364,30 +547,60 @@ class PIController(MotionController):
 
     ##
 
-    @staticmethod
-    def _retrieve_large_response(func, start_size=1024, max_size=2 ** 20, strip=True):
-        response, nbytes = None, start_size
-        while nbytes < max_size:
+    def _locked(self, func, *args):
+        """
+        Call a handle method of the controller or one of its axes, one call at a
+        time.
+        """
+        with self._lock:
+            return func(*args)
+
+    async def _run_sync(self, func, *args):
+        """
+        Same as _locked, but waits on a worker thread.
+        """
+        return await trio.to_thread.run_sync(self._locked, func, *args)
+
+    @classmethod
+    def _retrieve_large_response(
+        cls, func, start_size=2 ** 16, max_size=2 ** 20, strip=True
+    ):
+        """
+        Retrieve a response of unknown length, buffer grows on overflow.
+
+        Start size should cover the typical response, every overflow costs a
+        complete USB transaction. Buffer size that succeeded is remembered for
+        the next query of the same kind.
+        """
+        name = func.__name__
+        response, nbytes = None, max(start_size, cls._response_size.get(name, 0))
+        while nbytes <= max_size:
             try:
                 response = func(nbytes)
+                cls._response_size[name] = nbytes
                 if strip:
                     response = response.strip()
                 break
-            except RuntimeError as err:
-                if "overflow" in str(err):
-                    nbytes *= 2
-                    logger.warning(f"overflow, increase buffer to {nbytes} bytes")
-                else:
-                    raise
+            except BufferOverflowError:
+                nbytes *= 2
+                logger.warning("overflow, increase buffer to %d bytes", nbytes)
         return response
 
-    @lru_cache(maxsize=1)
+    @connection_cached
     def _valid_character_set(self):
         """
         Query valid character set for axis identifier.
         """
         return self.handle.get_valid_character_set()
 
+    @connection_cached
+    def _axis_id_pattern(self):
+        """
+        Pattern that matches a valid axis identifier.
+        """
+        charset = self._valid_character_set().strip()
+        return re.compile(f"[{re.escape(charset)}]+" if charset else r"\S+")
+
 
 class PIDaisyChain(Device):
     def __init__(self, driver, desc_str):
@@ -398,19 +611,31 @@ class PIDaisyChain(Device):
     ##
 
     async def test_open(self):
+        if not await self._is_daisy_chain():
+            raise UnsupportedClassError
+
+    async def _is_daisy_chain(self) -> bool:
+        """
+        Test whether the description belongs to a daisy-chain master with more
+        than one device, without raising for the common independent case.
+        """
         api = self.driver.api
         daisy_id = -1
         try:
-            daisy_id, n_dev, _ = api.open_usb_daisy_chain(self.desc_str)
-            if n_dev == 1:
-                # shunt to error
-                raise UnsupportedClassError
-            logger.info(f".. {self.info}")
+            daisy_id, n_dev, _ = await trio.to_thread.run_sync(
+                api.open_usb_daisy_chain, self.desc_str
+            )
         except RuntimeError as err:
-            logger.exception(err)
-            raise UnsupportedClassError
+            logger.debug("not a daisy chain, %s", err)
+            return False
         finally:
-            api.close_daisy_chain(daisy_id)
+            with trio.CancelScope(shield=True):
+                await trio.to_thread.run_sync(api.close_daisy_chain, daisy_id)
+
+        if n_dev == 1:
+            return False
+        logger.info(".. %s", self.info)
+        return True
 
     async def _open(self):
         self._daisy_id, self._n_members, _ = await trio.to_thread.run_sync(
@@ -443,12 +668,10 @@ class PIDaisyChain(Device):
     def desc_str(self):
         return self._desc_str
 
-    @property
-    @lru_cache(maxsize=1)
+    @cached_property
     def info(self):
         # extract info from *IDN?, since SSN? may not exist
-        vendor, *args = self.desc_str.split(" ")
-        sn = args[-1]
+        vendor, sn = self.desc_str.partition(" ")[0], self.desc_str.rpartition(" ")[2]
 
         return DeviceInfo(vendor=vendor, model="DAISY", version=None, serial_number=sn)
 
@@ -468,12 +691,11 @@ class PIDaisyController(PIController, MotionController):
         try:
             # use daisy ID from the parent
             await self.open()
-            logger.info(f".. {self.info}")
+            logger.info(".. %s", await trio.to_thread.run_sync(lambda: self.info))
         except RuntimeError as err:
             logger.exception(err)
-            raise UnsupportedClassError
-        finally:
             await self.close()
+            raise UnsupportedClassError
 
     async def _open(self):
         ctrl_id = await trio.to_thread.run_sync(
@@ -483,6 +705,11 @@ class PIDaisyController(PIController, MotionController):
         )
         self._handle = ControllerCommand(ctrl_id)
 
+    async def _close(self):
+        # daisy-chain ID changes every time the chain is opened, never pooled
+        await self._run_sync(self.driver.api.close_connection, self.handle.ctrl_id)
+        await super()._close()
+
     ##
 
     @property
@@ -491,8 +718,25 @@ class PIDaisyController(PIController, MotionController):
 
 
 class GCS2(Driver):
+    # DLL communication layer is shared by all driver instances
+    _api = None
+    # established USB connections, description string -> (controller ID, lock)
+    _connections = dict()
+    # controllers that are using a connection, description string -> controllers
+    _connection_users = defaultdict(weakref.WeakSet)
+    # serialize connect and close of the same description string
+    _connection_locks = defaultdict(trio.Lock)
+
     def __init__(self):
-        self._api = Communication()
+        if GCS2._api is None:
+            GCS2._api = Communication()
+        # number of USB transactions allowed in flight during enumeration
+        self._limiter = trio.CapacityLimiter(3)
+
+        # enumeration results, keyword -> (timestamp, description strings, axes)
+        self._enum_cache, self._enum_ttl = dict(), 300.0
+        # whether a description string belongs to a daisy-chain master
+        self._daisy_chain_memo = dict()
 
     ##
 
@@ -500,50 +744,227 @@ class GCS2(Driver):
         self.api.set_daisy_chain_scan_max_device_id(4)
 
     async def shutdown(self):
-        pass
+        for desc_str, users in list(GCS2._connection_users.items()):
+            users = [user for user in users if user.driver is self]
+            await self._disconnect_usb(desc_str, *users)
 
-    async def enumerate_devices(self, keyword: str = "") -> PIController:
-        response = self.api.enumerate_usb(keyword)
-        desc_strs = list(response.strip().split("\n"))
-        logger.debug(f"found {len(desc_strs)} controller candidate(s)")
+        # cached devices are bound to the connections that were just closed
+        self.invalidate_enumeration()
 
-        valid_controllers = []
-        for desc_str in desc_strs:
-            chain = PIDaisyChain(self, desc_str)
-            try:
-                await chain.test_open()
+    async def enumerate_devices(
+        self, keyword: str = "", force=False
+    ) -> Union[PILinear, PIRotary]:
+        """
+        Enumerate all the axes that are reachable through USB.
+
+        Results are cached for each keyword, since a full scan opens every
+        controller on the bus. Once expired, the cache is still reused if USB
+        description strings are unchanged and the controllers are still connected.
+
+        Args:
+            keyword (str, optional): filter for the USB description
+            force (bool, optional): ignore the cache and rescan the bus
+        """
+        cached = None if force else self._enum_cache.get(keyword)
+        if cached:
+            timestamp, _, axes = cached
+            if time.monotonic() - timestamp < self._enum_ttl:
+                return axes
+
+        response = await trio.to_thread.run_sync(self.api.enumerate_usb, keyword)
+        desc_strs = [line for line in response.splitlines() if line.strip()]
+        logger.debug("found %d controller candidate(s)", len(desc_strs))
+
+        unchanged = cached is not None and cached[1] == desc_strs
+        if unchanged and await self._is_connection_alive(cached[2]):
+            # same devices on the bus, skip the probes
+            axes = cached[2]
+        else:
+            axes = await self._enumerate_devices(desc_strs)
+        self._enum_cache[keyword] = (time.monotonic(), desc_strs, axes)
+        return axes
 
-                # a daisy-chain master
-                await chain.open()
-                # iterate over member index
-                n_members = await chain.get_property("number_of_members")
-                logger.info(f"found {n_members} member(s)")
+    async def _is_connection_alive(self, axes):
+        """
+        Test whether the pooled connections behind the axes are still alive.
+        Daisy-chain members are not pooled, they are not tested.
+        """
+        pooled = {ctrl_id for ctrl_id, _ in GCS2._connections.values()}
+        ctrl_ids = {
+            axis.handle.ctrl_id
+            for axis in axes
+            if not isinstance(axis.parent, PIDaisyController)
+        }
+        for ctrl_id in ctrl_ids:
+            if ctrl_id not in pooled or not await trio.to_thread.run_sync(
+                self.api.is_connected, ctrl_id
+            ):
+                logger.debug("controller %d is no longer connected", ctrl_id)
+                return False
+        return True
+
+    def invalidate_enumeration(self):
+        """Drop cached enumeration results, next call will rescan the bus."""
+        self._enum_cache.clear()
+        self._daisy_chain_memo.clear()
+
+    ##
+
+    async def _enumerate_devices(self, desc_strs):
+        # probe all candidates concurrently, preserve the enumeration order
+        candidates = [None] * len(desc_strs)
+        try:
+            async with trio.open_nursery() as nursery:
+                for i, desc_str in enumerate(desc_strs):
+                    nursery.start_soon(self._probe_candidate, desc_str, candidates, i)
+            valid_controllers = [
+                controller
+                for _, controllers in candidates
+                for controller in controllers
+            ]
+
+            # controllers have their own ID, enumerate them concurrently
+            valid_axes = [None] * len(valid_controllers)
+            async with trio.open_nursery() as nursery:
+                for i, controller in enumerate(valid_controllers):
+                    nursery.start_soon(self._enumerate_axes, controller, valid_axes, i)
+        finally:
+            # probed controllers and daisy-chain masters are kept alive until
+            # their axes are enumerated, close what is left even if it failed
+            for candidate in candidates:
+                if candidate is not None:
+                    chain, controllers = candidate
+                    await self._close_candidate(chain, controllers)
+        return tuple(axis for axes in valid_axes for axis in axes)
+
+    ##
+
+    async def _probe_candidate(self, desc_str, results, i):
+        """
+        Probe a USB candidate, either a daisy-chain master or an independent
+        controller. Tuple (chain, valid controllers) is stored in results[i],
+        an opened chain is returned if any of its members is valid.
+        """
+        chain = PIDaisyChain(self, desc_str)
+        is_daisy_chain = self._daisy_chain_memo.get(desc_str, True)
+        if is_daisy_chain:
+            async with self._limiter:
+                is_daisy_chain = await chain._is_daisy_chain()
+            self._daisy_chain_memo[desc_str] = is_daisy_chain
+        if not is_daisy_chain:
+            # rebuild an independent controller
+            device = PIController(self, desc_str)
+            valid = await self._probe_device(device)
+            results[i] = (None, (device,) if valid else tuple())
+            return
+
+        # a daisy-chain master
+        members = []
+        try:
+            await chain.open()
+            # iterate over member index
+            n_members = await chain.get_property("number_of_members")
+            logger.info("found %d member(s)", n_members)
+            members = [None] * n_members
+            async with trio.open_nursery() as nursery:
                 for index in range(1, n_members + 1):
-                    try:
-                        logger.debug(f".. index: {index}")
-                        device = PIDaisyController(chain, index)
-                        await device.test_open()
-                        valid_controllers.append(device)
-                    except UnsupportedClassError:
-                        pass
+                    logger.debug(".. index: %d", index)
+                    device = PIDaisyController(chain, index)
+                    nursery.start_soon(self._probe_member, device, members, index - 1)
+        except RuntimeError as err:
+            # a faulty chain should not abort the other candidates
+            logger.exception(err)
+            logger.error("unable to probe daisy chain %s", desc_str)
+            await self._close_candidate(chain, members)
+            results[i] = (None, tuple())
+            return
+        except BaseException:
+            await self._close_candidate(chain, members)
+            raise
+        members = tuple(device for device in members if device is not None)
+        if not members:
+            await self._close_candidate(chain, members)
+            chain = None
+        results[i] = (chain, members)
+
+    async def _close_candidate(self, chain, controllers):
+        """
+        Close probed controllers and their daisy-chain master, even if cancelled.
+        """
+        with trio.CancelScope(shield=True):
+            for controller in controllers:
+                if controller is not None:
+                    await controller.close()
+            if chain is not None:
                 await chain.close()
-            except UnsupportedClassError:
-                # rebuild an independent controller
-                device = PIController(self, desc_str)
-                try:
-                    await device.test_open()
-                    valid_controllers.append(device)
-                except UnsupportedClassError:
-                    pass
-
-        valid_axes = []
-        for controller in valid_controllers:
+
+    async def _connect_usb(self, desc_str, user):
+        """
+        Reuse the USB connection of a controller, connect on first use or if
+        the connection is lost. Connections are shared with other driver
+        instances, so is the lock that serializes calls on it.
+
+        Args:
+            desc_str (str): description string of the controller
+            user (PIController): controller that uses the connection
+
+        Returns:
+            (tuple): (controller ID, lock)
+        """
+        async with GCS2._connection_locks[desc_str]:
+            ctrl_id, lock = GCS2._connections.get(desc_str, (None, None))
+            if ctrl_id is not None and not await trio.to_thread.run_sync(
+                self.api.is_connected, ctrl_id
+            ):
+                # e.g. controller is power cycled
+                logger.warning("lost connection to %s, reconnecting", desc_str)
+                await trio.to_thread.run_sync(self.api.close_connection, ctrl_id)
+                ctrl_id = None
+            if ctrl_id is None:
+                ctrl_id = await trio.to_thread.run_sync(self.api.connect_usb, desc_str)
+                if lock is None:
+                    lock = threading.RLock()
+                GCS2._connections[desc_str] = (ctrl_id, lock)
+            GCS2._connection_users[desc_str].add(user)
+            return ctrl_id, lock
+
+    async def _disconnect_usb(self, desc_str, *users):
+        """
+        Release the USB connection from its users, it is closed once no
+        controller is using it.
+        """
+        async with GCS2._connection_locks[desc_str]:
+            remaining = GCS2._connection_users[desc_str]
+            for user in users:
+                remaining.discard(user)
+            if remaining:
+                return
+            del GCS2._connection_users[desc_str]
+            connection = GCS2._connections.pop(desc_str, None)
+            if connection is not None:
+                ctrl_id, _ = connection
+                await trio.to_thread.run_sync(self.api.close_connection, ctrl_id)
+
+    async def _enumerate_axes(self, controller, results, i):
+        # controllers are left opened by test_open
+        if not controller.is_opened:
             await controller.open()
-            try:
-                valid_axes.extend(await controller.enumerate_axes())
-            finally:
-                await controller.close()
-        return tuple(valid_axes)
+        try:
+            results[i] = await controller.enumerate_axes()
+        finally:
+            await controller.close()
+
+    async def _probe_member(self, device, results, i):
+        if await self._probe_device(device):
+            results[i] = device
+
+    async def _probe_device(self, device):
+        try:
+            async with self._limiter:
+                await device.test_open()
+            return True
+        except UnsupportedClassError:
+            return False
 
     ##
 
@@ -6,9 +6,12 @@ from cython cimport view
 from libcpp.vector cimport vector
 
 from enum import auto, Enum, IntEnum
+import logging
 
 from gcs2 cimport *
 
+logger = logging.getLogger(__name__)
+
 ##
 
 class ReferenceMode(IntEnum):
@@ -26,6 +29,15 @@ class ServoState(IntEnum):
 
 ##
 
+class BufferOverflowError(RuntimeError):
+    """Response does not fit in the provided buffer."""
+
+# DLL error code of a response that does not fit in the buffer
+cdef enum:
+    COM_BUFFER_OVERFLOW = -5
+
+##
+
 cdef translate_error(int err_id, int nbytes=1024):
     cdef char[::1] buffer = view.array(
         shape=(nbytes, ), itemsize=sizeof(char), format='c'
@@ -45,7 +57,7 @@ cdef class Communication:
     @staticmethod
     cdef check_error(int ret):
         if ret < 0:
-            print(f'err_id: {ret}')
+            logger.debug('err_id: %d', ret)
             raise RuntimeError(translate_error(ret))
 
     ##
@@ -159,17 +171,32 @@ cdef class ControllerCommand:
     Wrapper class for GCS2 commands. These commands are controller dependents.
     """
     cdef readonly int ctrl_id
+    # response buffer, reused across queries, not safe to share between threads
+    cdef char[::1] buffer
 
     def __cinit__(self, int ctrl_id, *args):
         self.ctrl_id = ctrl_id
+        self.buffer = None
 
     cdef check_error(self, int ret):
         if ret > 0:
             # true, successful
             return
         err_id = PI_GetError(self.ctrl_id)
+        if err_id == COM_BUFFER_OVERFLOW:
+            raise BufferOverflowError(translate_error(err_id))
         raise RuntimeError(translate_error(err_id))
 
+    cdef char *response_buffer(self, int nbytes) except NULL:
+        """
+        Get the response buffer, it only grows when requested size is larger.
+        """
+        if self.buffer is None or self.buffer.shape[0] < nbytes:
+            self.buffer = view.array(
+                shape=(nbytes, ), itemsize=sizeof(char), format='c'
+            )
+        return &self.buffer[0]
+
     ##
 
     cpdef set_error_check(self, pybool err_check):
@@ -211,10 +238,7 @@ cdef class ControllerCommand:
 
     cpdef get_axes_id(self, pybool include_deactivated=True, int nbytes=512):
         """qSAI/qSAI_ALL"""
-        cdef char[::1] buffer = view.array(
-            shape=(nbytes, ), itemsize=sizeof(char), format='c'
-        )
-        cdef char *c_buffer = &buffer[0]
+        cdef char *c_buffer = self.response_buffer(nbytes)
 
         if include_deactivated:
             ret = PI_qSAI_ALL(self.ctrl_id, c_buffer, nbytes)
@@ -224,6 +248,53 @@ cdef class ControllerCommand:
 
         return c_buffer.decode('ascii', errors='replace')
 
+    ## parameters ##
+    cpdef get_parameters(
+        self, axes, parameters, pybool volatile=False, int nbytes=1024
+    ):
+        """
+        qSEP/qSPA
+
+        Query multiple parameters in a single transaction.
+
+        Args:
+            axes (list of str): axis identifier of each parameter
+            parameters (list of int): parameter IDs
+            volatile (bool, optional): query volatile memory (qSPA) instead of non-volatile memory (qSEP)
+            nbytes (int, optional): size of the buffer to receive string values
+        """
+        b_axes = " ".join(axes).encode('ascii')
+        cdef char *c_axes = b_axes
+
+        cdef vector[unsigned int] v_parameters = parameters
+        cdef vector[double] v_values
+        v_values.resize(v_parameters.size())
+
+        cdef char *c_string = self.response_buffer(nbytes)
+
+        if volatile:
+            ret = PI_qSPA(
+                self.ctrl_id,
+                c_axes,
+                v_parameters.data(),
+                v_values.data(),
+                c_string,
+                nbytes
+            )
+        else:
+            ret = PI_qSEP(
+                self.ctrl_id,
+                c_axes,
+                v_parameters.data(),
+                v_values.data(),
+                c_string,
+                nbytes
+            )
+        self.check_error(ret)
+
+        # string values are separated by line feeds
+        return list(v_values), c_string.decode('ascii', errors='replace').split('\n')
+
     ## motions ##
     cpdef stop_all(self):
         """#24"""
@@ -233,10 +304,7 @@ cdef class ControllerCommand:
     ## utils ##
     cpdef get_available_commands(self, int nbytes=512):
         """qHLP"""
-        cdef char[::1] buffer = view.array(
-            shape=(nbytes, ), itemsize=sizeof(char), format='c'
-        )
-        cdef char *c_buffer = &buffer[0]
+        cdef char *c_buffer = self.response_buffer(nbytes)
 
         ret = PI_qHLP(self.ctrl_id, c_buffer, nbytes)
         self.check_error(ret)
@@ -245,10 +313,7 @@ cdef class ControllerCommand:
 
     cpdef get_identification_string(self, int nbytes=256):
         """qIDN"""
-        cdef char[::1] buffer = view.array(
-            shape=(nbytes, ), itemsize=sizeof(char), format='c'
-        )
-        cdef char *c_buffer = &buffer[0]
+        cdef char *c_buffer = self.response_buffer(nbytes)
 
         ret = PI_qIDN(self.ctrl_id, c_buffer, nbytes)
         self.check_error(ret)
@@ -257,10 +322,7 @@ cdef class ControllerCommand:
 
     cpdef get_available_parameters(self, int nbytes=512):
         """qHPA"""
-        cdef char[::1] buffer = view.array(
-            shape=(nbytes, ), itemsize=sizeof(char), format='c'
-        )
-        cdef char *c_buffer = &buffer[0]
+        cdef char *c_buffer = self.response_buffer(nbytes)
 
         ret = PI_qHPA(self.ctrl_id, c_buffer, nbytes)
         self.check_error(ret)
@@ -269,10 +331,7 @@ cdef class ControllerCommand:
 
     cpdef get_valid_character_set(self, int nbytes=512):
         """qTVI"""
-        cdef char[::1] buffer = view.array(
-            shape=(nbytes, ), itemsize=sizeof(char), format='c'
-        )
-        cdef char *c_buffer = &buffer[0]
+        cdef char *c_buffer = self.response_buffer(nbytes)
 
         ret = PI_qTVI(self.ctrl_id, c_buffer, nbytes)
         self.check_error(ret)
@@ -281,10 +340,7 @@ cdef class ControllerCommand:
 
     cpdef get_version(self, int nbytes=512):
         """qVER"""
-        cdef char[::1] buffer = view.array(
-            shape=(nbytes, ), itemsize=sizeof(char), format='c'
-        )
-        cdef char *c_buffer = &buffer[0]
+        cdef char *c_buffer = self.response_buffer(nbytes)
 
         ret = PI_qVER(self.ctrl_id, c_buffer, nbytes)
         self.check_error(ret)
@@ -464,10 +520,7 @@ cdef class AxisCommand(ControllerCommand):
 
     cpdef get_stage_type(self, int nbytes=512):
         """qCST"""
-        cdef char[::1] buffer = view.array(
-            shape=(nbytes, ), itemsize=sizeof(char), format='c'
-        )
-        cdef char *c_buffer = &buffer[0]
+        cdef char *c_buffer = self.response_buffer(nbytes)
 
         cdef char *c_axis_id = self.axis_id
         ret = PI_qCST(self.ctrl_id, c_axis_id, c_buffer, nbytes)
@@ -481,15 +534,11 @@ cdef class AxisCommand(ControllerCommand):
         """qSEP/qSPA"""
         cdef char *c_axis_id = self.axis_id
 
-        cdef double[::1] values = view.array(
-            shape=(nelem, ), itemsize=sizeof(double), format='g'
-        )
-        cdef double *c_values = &values[0]
+        cdef vector[double] v_values
+        v_values.resize(nelem)
+        cdef double *c_values = v_values.data()
 
-        cdef char[::1] string = view.array(
-            shape=(nbytes, ), itemsize=sizeof(char), format='c'
-        )
-        cdef char *c_string = &string[0]
+        cdef char *c_string = self.response_buffer(nbytes)
 
         if volatile:
             ret = PI_qSPA(
@@ -511,7 +560,7 @@ cdef class AxisCommand(ControllerCommand):
             )
         self.check_error(ret)
 
-        return values, c_string.decode('ascii', errors='replace')
+        return list(v_values), c_string.decode('ascii', errors='replace')
 
     cpdef set_parameter(
         self,